@@ -1,17 +1,28 @@
 import os
 import sys
-import fitz  # PyMuPDF
-from PIL import Image
-import io
-import img2pdf
+# PyMuPDF (fitz), PIL, numpy, img2pdf sowie die optionalen numba/turbojpeg werden erst bei
+# der ersten Konvertierung importiert, damit das Fenster ohne deren Ladezeit erscheint
+import functools
+import tempfile
+import math
+import struct
 import time
 import tkinter as tk
 from tkinter import ttk, filedialog, messagebox, scrolledtext
 import threading
+import collections
+import queue
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor, as_completed
 import webbrowser
 import platform
 import datetime
 import json
+try:
+    import orjson
+except ImportError:  # orjson ist optional, für die kleine Einstellungsdatei reicht auch json
+    orjson = None
+import re
 import logging
 from logging.handlers import RotatingFileHandler
 
@@ -19,12 +30,14 @@ from logging.handlers import RotatingFileHandler
 log_formatter = logging.Formatter('%(asctime)s - %(levelname)s - %(message)s')
 log_file = "pdf_converter.log"
 
-log_handler = RotatingFileHandler(log_file, maxBytes=5*1024*1024, backupCount=2)
-log_handler.setFormatter(log_formatter)
-
 logger = logging.getLogger()
 logger.setLevel(logging.INFO)
-logger.addHandler(log_handler)
+
+def setup_logging():
+    """Hängt die Logdatei an; nur im Hauptprozess, damit nicht mehrere Prozesse dieselbe Datei rotieren"""
+    log_handler = RotatingFileHandler(log_file, maxBytes=5*1024*1024, backupCount=2)
+    log_handler.setFormatter(log_formatter)
+    logger.addHandler(log_handler)
 
 # Globale Einstellungen
 SETTINGS_FILE = "pdf_converter_settings.json"
@@ -39,14 +52,25 @@ DEFAULT_SETTINGS = {
     "mode": "bw",  # 'bw' oder 'grayscale'
     "page_range": "",
     "overwrite": "ask",  # 'ask', 'overwrite', 'skip'
-    "compression": 95
+    "compression": 95,
+    "parallel_files": min(4, os.cpu_count() or 1)
 }
 
+def _loads_settings(data):
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+def _dumps_settings(settings):
+    if orjson is not None:
+        return orjson.dumps(settings, option=orjson.OPT_INDENT_2)
+    return json.dumps(settings).encode()
+
 def load_settings():
     if os.path.exists(SETTINGS_FILE):
         try:
-            with open(SETTINGS_FILE, 'r') as f:
-                settings = json.load(f)
+            with open(SETTINGS_FILE, 'rb') as f:
+                settings = _loads_settings(f.read())
                 # Stelle sicher, dass alle Einstellungen vorhanden sind
                 for key, value in DEFAULT_SETTINGS.items():
                     if key not in settings:
@@ -58,39 +82,485 @@ def load_settings():
         return DEFAULT_SETTINGS.copy()
 
 def save_settings(settings):
-    with open(SETTINGS_FILE, 'w') as f:
-        json.dump(settings, f, indent=4)
+    with open(SETTINGS_FILE, 'wb') as f:
+        f.write(_dumps_settings(settings))
+
+# Ein Eintrag des Seitenbereichs: "3", "1-5", "-5" (ab Seite 1) oder "8-" (bis zur letzten Seite)
+_PAGE_RANGE_RE = re.compile(r'(\d*)\s*-\s*(\d*)|(\d+)')
 
 # Hilfsfunktion zur Analyse des Seitenbereichs
 def parse_page_range(page_range_str, total_pages):
     if not page_range_str.strip():
         return list(range(total_pages))
     
-    pages = []
-    parts = page_range_str.split(',')
-    for part in parts:
+    pages = set()
+    for part in page_range_str.split(','):
         part = part.strip()
-        if '-' in part:
-            start_end = part.split('-')
-            if len(start_end) == 2:
-                start, end = start_end
-                start = int(start.strip()) if start.strip() else 1
-                end = int(end.strip()) if end.strip() else total_pages
-                start = max(1, start)
-                end = min(total_pages, end)
-                pages.extend(range(start-1, end))
+        if not part:
+            continue
+        match = _PAGE_RANGE_RE.fullmatch(part)
+        if match is None:
+            raise ValueError(f"Ungültiger Eintrag '{part}'")
+        start, end, single = match.groups()
+        if single:
+            page = int(single)
+            if 1 <= page <= total_pages:
+                pages.add(page-1)
         else:
-            if part.strip():
-                try:
-                    page = int(part.strip())
-                    if 1 <= page <= total_pages:
-                        pages.append(page-1)
-                except ValueError:
-                    pass
-    # Duplikate entfernen und sortieren
-    return sorted(set(pages))
+            start = max(1, int(start) if start else 1)
+            end = min(total_pages, int(end) if end else total_pages)
+            pages.update(range(start-1, end))
+    # Sortieren, Duplikate sind durch das Set bereits entfernt
+    return sorted(pages)
+
+# Seiten pro Prozessaufgabe, damit sich der Start der Worker-Prozesse amortisiert
+PAGES_PER_TASK = 4
+
+# Obergrenze der gerenderten Pixel pro Seite (~40 MP, etwa A3 bei 400 DPI)
+MAX_PIXELS = 40_000_000
+
+# Ohne numba werden größere BW-Seiten in Streifen von höchstens so vielen Pixeln gerendert, damit die
+# Zwischenarrays von np.packbits nicht für die ganze Seite entstehen. Das PIL-Bild für die G4-Kodierung
+# belegt aber in jedem Fall ein Byte pro Pixel der ganzen Seite.
+STRIP_PIXELS = 8_000_000
+
+# Höchste im GUI wählbare Auflösung; darüber steigt nur der Aufwand, nicht die sichtbare Qualität
+MAX_DPI = 600
+
+def _get_max_workers(num_tasks):
+    return max(1, min(os.cpu_count() or 1, num_tasks))
+
+def _pool_context():
+    """
+    Startmethode der Prozesspools: spawn statt fork, da die Pools aus dem Konvertierungs-Thread
+    eines Tk-Prozesses gestartet werden, der den numba-Kern eventuell schon ausgeführt hat;
+    fork ist dort weder thread- noch numba-sicher
+    """
+    return multiprocessing.get_context('spawn')
+
+def _init_worker():
+    # Die Prozesse laufen bereits parallel, numba soll nicht zusätzlich alle Kerne belegen
+    if 'numba' in sys.modules:
+        sys.modules['numba'].set_num_threads(1)
+    else:
+        os.environ['NUMBA_NUM_THREADS'] = '1'
+
+class _LogCollector(logging.Handler):
+    """
+    Sammelt Logeinträge als (Level, Meldung, Logtext), um sie aus einem Pool-Prozess zurückzugeben.
+    Der Logtext enthält zusätzlich einen eventuellen Traceback.
+    """
+    def __init__(self):
+        super().__init__()
+        self.records = []
+        self.setFormatter(logging.Formatter('%(message)s'))
+    
+    def emit(self, record):
+        self.records.append((record.levelno, record.getMessage(), self.format(record)))
+
+def _convert_file_job(input_path, output_path, page_range, options, page_workers):
+    """
+    Konvertiert eine Datei im Prozesspool der Stapelverarbeitung
+    
+    :return: (Erfolg, Liste der Logeinträge als (Level, Meldung, Logtext)) zum Protokollieren im Hauptprozess
+    """
+    collector = _LogCollector()
+    logger.addHandler(collector)
+    try:
+        success = convert_pdf_to_bw(
+            input_path,
+            output_path,
+            threshold=options['threshold'],
+            dpi=options['dpi'],
+            page_range=page_range,
+            mode=options['mode'],
+            compression=options['compression'],
+            max_workers=page_workers
+        )
+    finally:
+        logger.removeHandler(collector)
+    return success, collector.records
+
+# Kacheln des Binarisierungs-Kerns: 64 Zeilen x 4096 Pixel. Jedes Pixel wird genau einmal gelesen,
+# die Kacheln bringen also keine Wiederverwendung im Cache; sie verteilen nur die Arbeit in gleich
+# großen Blöcken auf die Threads. Für Seiten bis 4096 Pixel Breite entspricht das einem Zeilendurchlauf.
+TILE_ROWS = 64
+TILE_COLS = 4096
+
+@functools.lru_cache(maxsize=None)
+def _get_binarize_kernel():
+    """Kompiliert den numba-Kern beim ersten Gebrauch; None, falls numba nicht installiert ist"""
+    try:
+        from numba import njit, prange
+    except ImportError:  # numba ist optional, sonst wird mit NumPy binarisiert
+        return None
+    
+    @njit(parallel=True, cache=True)
+    def _binarize_pack_kernel(gray, threshold, packed):
+        height, width = gray.shape
+        row_bytes = packed.shape[1]
+        full_bytes = width // 8
+        tile_bytes = TILE_COLS // 8
+        num_row_tiles = (height + TILE_ROWS - 1) // TILE_ROWS
+        for tile in prange(num_row_tiles):
+            r0 = tile * TILE_ROWS
+            r1 = min(r0 + TILE_ROWS, height)
+            for b0 in range(0, full_bytes, tile_bytes):
+                b1 = min(b0 + tile_bytes, full_bytes)
+                for r in range(r0, r1):
+                    for byte_idx in range(b0, b1):
+                        c = byte_idx * 8
+                        b = 0
+                        for bit in range(8):
+                            b = (b << 1) | (gray[r, c + bit] >= threshold)
+                        packed[r, byte_idx] = b
+            # Unvollständiges letztes Byte einer Zeile, Restbits bleiben 0
+            if full_bytes < row_bytes:
+                for r in range(r0, r1):
+                    b = 0
+                    for bit in range(8):
+                        c = full_bytes * 8 + bit
+                        b <<= 1
+                        if c < width and gray[r, c] >= threshold:
+                            b |= 1
+                    packed[r, full_bytes] = b
+    
+    return _binarize_pack_kernel
+
+@functools.lru_cache(maxsize=None)
+def _get_turbojpeg():
+    """Liefert die TurboJPEG-Instanz des Prozesses oder None, falls PyTurboJPEG bzw. libjpeg-turbo fehlt"""
+    try:
+        from turbojpeg import TurboJPEG
+    except ImportError:  # PyTurboJPEG ist optional, sonst kodiert MuPDF
+        return None
+    try:
+        return TurboJPEG()
+    except (OSError, RuntimeError):
+        return None
+
+def _save_group4(bw_img, output_path, dpi):
+    """
+    Speichert ein 1-Bit-Bild als CCITT-G4-TIFF mit nur einem Strip.
+    img2pdf bettet nur solche TIFFs unverändert ein, Pillows Standard (64-KB-Strips)
+    würde dort dekodiert und erneut G4-kodiert.
+    Die Auflösung wird mitgespeichert, damit img2pdf die ursprüngliche Seitengröße übernimmt.
+    """
+    from PIL import TiffImagePlugin
+    
+    default_strip_size = getattr(TiffImagePlugin, 'STRIP_SIZE', None)
+    if default_strip_size is not None:
+        TiffImagePlugin.STRIP_SIZE = (bw_img.width + 7) // 8 * bw_img.height
+    try:
+        bw_img.save(output_path, format='TIFF', compression='group4', dpi=(dpi, dpi))
+    finally:
+        if default_strip_size is not None:
+            TiffImagePlugin.STRIP_SIZE = default_strip_size
+
+def _set_jfif_dpi(jpeg_data, dpi, y_dpi=None):
+    """
+    Trägt die Auflösung in den JFIF-Kopf eines JPEGs ein (TurboJPEG schreibt nur ein Seitenverhältnis).
+    Ohne JFIF-Segment wird eines direkt nach dem SOI-Marker eingefügt.
+    :param y_dpi: vertikale Auflösung, falls sie von der horizontalen abweicht
+    """
+    y_dpi = dpi if y_dpi is None else y_dpi
+    density = struct.pack('>BHH', 1, round(dpi), round(y_dpi))  # Einheit 1 = Pixel pro Zoll
+    if jpeg_data[2:4] == b'\xff\xe0' and jpeg_data[6:11] == b'JFIF\x00':
+        return jpeg_data[:13] + density + jpeg_data[18:]
+    app0 = b'\xff\xe0' + struct.pack('>H', 16) + b'JFIF\x00\x01\x01' + density + b'\x00\x00'
+    return jpeg_data[:2] + app0 + jpeg_data[2:]
+
+class _PackBuffer:
+    """Wachsender Puffer für gepackte 1-Bit-Seiten, der über alle Seiten eines Prozesses wiederverwendet wird"""
+    
+    def __init__(self):
+        self._buf = None
+    
+    def view(self, height, row_bytes):
+        import numpy as np
+        
+        size = height * row_bytes
+        if self._buf is None or self._buf.size < size:
+            self._buf = np.empty(size, dtype=np.uint8)
+        return self._buf[:size].reshape(height, row_bytes)
+
+@functools.lru_cache(maxsize=None)
+def _get_pack_buffer():
+    """Ein Puffer pro Prozess, damit er über die Aufgaben eines Pool-Workers hinweg bestehen bleibt"""
+    return _PackBuffer()
+
+def _binarize_pack(gray, threshold, out=None):
+    """
+    Wendet den Schwellenwert an und packt das Ergebnis auf 1 Bit pro Pixel (weiß = 1)
+    :param gray: 2D-uint8-Array mit Graustufen
+    :param out: Optionales Zielarray passender Größe, in das der numba-Kern direkt schreibt;
+                ohne numba wird das Ergebnis hineinkopiert, nur sinnvoll für Streifen einer Seite
+    :return: 2D-uint8-Array mit (Breite+7)//8 Bytes pro Zeile
+    """
+    import numpy as np
+    
+    kernel = _get_binarize_kernel()
+    if kernel is None:
+        packed = np.packbits(gray >= threshold, axis=1)
+        if out is None:
+            return packed
+        out[...] = packed
+        return out
+    
+    if out is None:
+        height, width = gray.shape
+        out = np.empty((height, (width + 7) // 8), dtype=np.uint8)
+    kernel(gray, threshold, out)
+    return out
 
-def convert_pdf_to_bw(input_pdf, output_pdf, threshold=150, dpi=300, progress_callback=None, page_range=None, mode='bw', compression=95):
+def _render_bw_strips(page, matrix, threshold, pack_buffer=None):
+    """
+    Rendert eine große Seite in horizontalen Streifen und binarisiert jeden Streifen sofort.
+    Graustufenbild und Zwischenarrays liegen so nur streifenweise im Speicher; die Spitze bestimmt
+    danach das PIL-Bild für die G4-Kodierung mit einem Byte pro Pixel.
+    :return: Tupel aus Bildbreite in Pixeln und gepackter Seite (2D-uint8-Array)
+    """
+    import fitz  # PyMuPDF
+    import numpy as np
+    
+    page_irect = (page.rect * matrix).irect
+    width, height = page_irect.width, page_irect.height
+    row_bytes = (width + 7) // 8
+    if pack_buffer is not None:
+        packed = pack_buffer.view(height, row_bytes)
+    else:
+        packed = np.empty((height, row_bytes), dtype=np.uint8)
+    
+    zoom = matrix.a
+    strip_height = max(64, STRIP_PIXELS // width)
+    for y in range(0, height, strip_height):
+        y_end = min(y + strip_height, height)
+        # Je eine Zeile Rand oben und unten fängt Rundungen beim Zuschnitt ab
+        clip = fitz.Rect(
+            page.rect.x0, (page_irect.y0 + y - 1) / zoom,
+            page.rect.x1, (page_irect.y0 + y_end + 1) / zoom
+        )
+        pix = page.get_pixmap(matrix=matrix, colorspace=fitz.csGRAY, alpha=False, clip=clip)
+        strip = np.frombuffer(pix.samples_mv, dtype=np.uint8).reshape(pix.height, pix.width)
+        row0 = page_irect.y0 + y - pix.y
+        col0 = page_irect.x0 - pix.x
+        _binarize_pack(strip[row0:row0 + y_end - y, col0:col0 + width], threshold, packed[y:y_end])
+    
+    return width, packed
+
+def _effective_dpi(page, dpi):
+    """Reduziert die Auflösung, falls die Seite sonst mehr als MAX_PIXELS Pixel hätte"""
+    rect = page.rect
+    pixels = (rect.width * dpi/72) * (rect.height * dpi/72)
+    if pixels <= MAX_PIXELS:
+        return dpi
+    return dpi * math.sqrt(MAX_PIXELS / pixels)
+
+def _render_page(page, output_path, dpi, mode, threshold, compression, pack_buffer=None):
+    """
+    Rendert eine einzelne Seite und speichert sie als TIFF (BW) bzw. JPEG (Graustufen)
+    :param pack_buffer: Optionaler _PackBuffer, der zwischen Seiten wiederverwendet wird
+    :return: Tatsächlich verwendete DPI
+    """
+    import fitz  # PyMuPDF
+    import numpy as np
+    from PIL import Image
+    
+    dpi = _effective_dpi(page, dpi)
+    matrix = fitz.Matrix(dpi/72, dpi/72)
+    
+    if mode == 'bw':
+        page_size = page.rect * matrix
+        # Mit numba braucht die ganze Seite nicht mehr Speicher als das spätere PIL-Bild, Streifen
+        # würden dann nur den Seiteninhalt mehrfach interpretieren
+        if (page.rotation == 0 and _get_binarize_kernel() is None
+                and page_size.width * page_size.height > 2 * STRIP_PIXELS):
+            width, packed = _render_bw_strips(page, matrix, threshold, pack_buffer)
+        else:
+            # Nur Graustufen nötig: MuPDF liefert direkt 8 Bit pro Pixel
+            pix = page.get_pixmap(matrix=matrix, colorspace=fitz.csGRAY, alpha=False)
+            # samples_mv ist eine Sicht auf den Pixmap-Speicher, samples wäre eine Kopie
+            gray = np.frombuffer(pix.samples_mv, dtype=np.uint8).reshape(pix.height, pix.width)
+            # Nur der numba-Kern schreibt direkt in den Puffer, np.packbits legt ohnehin ein neues Array an
+            out = None
+            if pack_buffer is not None and _get_binarize_kernel() is not None:
+                out = pack_buffer.view(pix.height, (pix.width + 7) // 8)
+            width, packed = pix.width, _binarize_pack(gray, threshold, out)
+            # Graustufenbild freigeben, bevor PIL die Seite mit einem Byte pro Pixel entpackt
+            del pix, gray
+        
+        bw_img = Image.frombuffer('1', (width, packed.shape[0]), packed, 'raw', '1', 0, 1)
+        _save_group4(bw_img, output_path, dpi)
+    else:  # Graustufen
+        pix = page.get_pixmap(matrix=matrix, colorspace=fitz.csGRAY, alpha=False)
+        jpeg = _get_turbojpeg()
+        if jpeg is not None:
+            from turbojpeg import TJPF_GRAY, TJSAMP_GRAY
+            gray = np.frombuffer(pix.samples_mv, dtype=np.uint8).reshape(pix.height, pix.width)
+            jpeg_data = jpeg.encode(gray, quality=compression, pixel_format=TJPF_GRAY, jpeg_subsample=TJSAMP_GRAY)
+            jpeg_data = _set_jfif_dpi(jpeg_data, dpi)
+        else:
+            # Ohne libjpeg-turbo kodiert MuPDF direkt, ohne Umweg über ein PIL-Bild
+            pix.set_dpi(round(dpi), round(dpi))
+            jpeg_data = pix.tobytes("jpg", jpg_quality=compression)
+        with open(output_path, 'wb') as f:
+            f.write(jpeg_data)
+    
+    return dpi
+
+def _pdf_key(doc, xref, key):
+    """Liest einen Eintrag eines PDF-Objekts; None, falls er fehlt"""
+    value_type, value = doc.xref_get_key(xref, key)
+    return None if value_type == 'null' else value
+
+def _ccitt_g4_tiff(data, width, height, x_dpi, y_dpi):
+    """
+    Verpackt einen rohen CCITT-G4-Datenstrom ohne Neukodierung in ein TIFF mit einem Strip,
+    das img2pdf unverändert einbettet
+    """
+    num_entries = 12
+    res_offset = 8 + 2 + num_entries * 12 + 4
+    data_offset = res_offset + 16
+    # (Tag, Typ, Wert) mit Typ 3 = SHORT, 4 = LONG, 5 = RATIONAL (Wert ist dann ein Offset)
+    entries = [
+        (256, 4, width),        # ImageWidth
+        (257, 4, height),       # ImageLength
+        (258, 3, 1),            # BitsPerSample
+        (259, 3, 4),            # Compression: CCITT Group 4
+        (262, 3, 0),            # PhotometricInterpretation: WhiteIsZero
+        (273, 4, data_offset),  # StripOffsets
+        (277, 3, 1),            # SamplesPerPixel
+        (278, 4, height),       # RowsPerStrip: ein einziger Strip
+        (279, 4, len(data)),    # StripByteCounts
+        (282, 5, res_offset),   # XResolution
+        (283, 5, res_offset + 8),  # YResolution
+        (296, 3, 2),            # ResolutionUnit: Zoll
+    ]
+    
+    header = b'II*\x00' + struct.pack('<I', 8)
+    ifd = struct.pack('<H', num_entries)
+    for tag, value_type, value in entries:
+        packed_value = struct.pack('<HH', value, 0) if value_type == 3 else struct.pack('<I', value)
+        ifd += struct.pack('<HHI', tag, value_type, 1) + packed_value
+    ifd += struct.pack('<I', 0)
+    resolution = struct.pack('<II', round(x_dpi * 100), 100) + struct.pack('<II', round(y_dpi * 100), 100)
+    return header + ifd + resolution + data
+
+def _passthrough_page(doc, page, output_path, mode):
+    """
+    Übernimmt eine Seite ohne Rendern, wenn sie nur aus einem einzigen, seitenfüllenden Bild besteht,
+    das bereits dem Ziel entspricht: CCITT-G4 für BW, Graustufen-JPEG für Graustufen
+    :return: True, falls der Bilddatenstrom unverändert nach output_path geschrieben wurde
+    """
+    if page.rotation != 0:
+        return False
+    
+    # Günstiger Vorfilter über die Ressourcen der Seite, bevor der Inhalt ausgewertet wird
+    image_list = page.get_images(full=True)
+    if len(image_list) != 1:
+        return False
+    xref = image_list[0][0]
+    
+    # Masken, Farbumkehr oder Transparenz würden beim direkten Einbetten verloren gehen
+    if (_pdf_key(doc, xref, 'ImageMask') == 'true' or _pdf_key(doc, xref, 'Decode')
+            or _pdf_key(doc, xref, 'SMask') or _pdf_key(doc, xref, 'Mask')):
+        return False
+    
+    width = int(_pdf_key(doc, xref, 'Width') or 0)
+    height = int(_pdf_key(doc, xref, 'Height') or 0)
+    image_filter = _pdf_key(doc, xref, 'Filter')
+    if mode == 'bw':
+        if image_filter not in ('/CCITTFaxDecode', '[/CCITTFaxDecode]'):
+            return False
+        if (int(_pdf_key(doc, xref, 'DecodeParms/K') or 0) >= 0
+                or _pdf_key(doc, xref, 'DecodeParms/BlackIs1') == 'true'
+                or _pdf_key(doc, xref, 'DecodeParms/EncodedByteAlign') == 'true'
+                or int(_pdf_key(doc, xref, 'DecodeParms/Columns') or 1728) != width):
+            return False
+    else:
+        if (image_filter not in ('/DCTDecode', '[/DCTDecode]')
+                or _pdf_key(doc, xref, 'ColorSpace') != '/DeviceGray'):
+            return False
+    
+    images = page.get_image_info(xrefs=True)
+    if len(images) != 1 or images[0]['xref'] != xref:
+        return False
+    a, b, c, d, _, _ = images[0]['transform']
+    if b != 0 or c != 0 or a <= 0 or d <= 0:
+        return False
+    # Das Bild muss die Seite bis auf Rundungsdifferenzen (2 pt) ausfüllen
+    if any(abs(p - q) > 2 for p, q in zip(page.rect, images[0]['bbox'])):
+        return False
+    
+    # Sichtbare Inhalte neben dem Bild (Vektorgrafik, Anmerkungen, nicht unsichtbarer Text)
+    # würden fehlen; eine unsichtbare OCR-Textebene geht ohnehin verloren
+    if page.first_annot is not None or page.get_drawings():
+        return False
+    if any(span['type'] != 3 for span in page.get_texttrace()):
+        return False
+    
+    # Auflösung so, dass die Seite dieselbe physische Größe behält wie die gerenderten Seiten
+    x_dpi = width / (page.rect.width / 72)
+    y_dpi = height / (page.rect.height / 72)
+    data = doc.xref_stream_raw(xref)
+    if mode == 'bw':
+        data = _ccitt_g4_tiff(data, width, height, x_dpi, y_dpi)
+    else:
+        data = _set_jfif_dpi(data, x_dpi, y_dpi)
+    with open(output_path, 'wb') as f:
+        f.write(data)
+    return True
+
+def _render_document_pages(doc, pages, tmp_dir, dpi, mode, threshold, compression):
+    """
+    Rendert einen Block von Seiten eines bereits geöffneten Dokuments in Einzeldateien
+    :param pages: Liste von (idx, page_num)-Tupeln
+    :param tmp_dir: Verzeichnis für die gerenderten Seitenbilder
+    :return: Liste von (idx, Bildpfad, verwendete DPI, unverändert übernommen)-Tupeln
+    """
+    ext = 'tif' if mode == 'bw' else 'jpg'
+    pack_buffer = _get_pack_buffer()
+    results = []
+    for idx, page_num in pages:
+        page = doc.load_page(page_num)
+        image_path = os.path.join(tmp_dir, f"page_{idx:05d}.{ext}")
+        try:
+            passthrough = _passthrough_page(doc, page, image_path, mode)
+        except Exception as e:
+            # Unerwartete Bildparameter o. Ä.: die Seite wird dann einfach normal gerendert
+            logger.warning(f"Direkte Übernahme von Seite {page_num+1} fehlgeschlagen, wird gerendert: {str(e)}",
+                           exc_info=True)
+            passthrough = False
+        if passthrough:
+            results.append((idx, image_path, dpi, True))
+            continue
+        used_dpi = _render_page(page, image_path, dpi, mode, threshold, compression, pack_buffer)
+        results.append((idx, image_path, used_dpi, False))
+    return results
+
+# Im Pool-Prozess geöffnete PDF, die über alle Aufgaben des Prozesses weiterverwendet wird
+_worker_doc = None
+
+def _get_worker_document(input_pdf):
+    """Öffnet die PDF einmal pro Worker-Prozess, da fitz.Document nicht zwischen Prozessen geteilt werden kann"""
+    global _worker_doc
+    import fitz  # PyMuPDF
+    
+    if _worker_doc is None or _worker_doc.name != input_pdf:
+        if _worker_doc is not None:
+            _worker_doc.close()
+        _worker_doc = fitz.open(input_pdf)
+    return _worker_doc
+
+def _render_pages(input_pdf, pages, tmp_dir, dpi, mode, threshold, compression):
+    """
+    Worker für den Prozesspool: rendert einen Block von Seiten in Einzeldateien
+    :return: siehe _render_document_pages
+    """
+    doc = _get_worker_document(input_pdf)
+    return _render_document_pages(doc, pages, tmp_dir, dpi, mode, threshold, compression)
+
+def convert_pdf_to_bw(input_pdf, output_pdf, threshold=150, dpi=300, progress_callback=None, page_range=None, mode='bw', compression=95, max_workers=None):
     """
     Konvertiert eine PDF in eine Schwarz-Weiß- oder Graustufen-PDF
     :param input_pdf: Pfad zur Eingabe-PDF
@@ -98,10 +568,14 @@ def convert_pdf_to_bw(input_pdf, output_pdf, threshold=150, dpi=300, progress_ca
     :param threshold: Schwellenwert (0-255), niedrig = dunkler (nur für BW)
     :param dpi: Auflösung für Bildkonvertierung
     :param progress_callback: Callback für Fortschrittsupdates
-    :param page_range: Liste der zu verarbeitenden Seiten (0-basiert)
+    :param page_range: Liste der zu verarbeitenden Seiten (0-basiert) oder Seitenbereich als Text (z.B. "1-5,8")
     :param mode: 'bw' für Schwarz-Weiß, 'grayscale' für Graustufen
     :param compression: Kompressionsstufe (1-100)
+    :param max_workers: Anzahl der Render-Prozesse (None = automatisch, 1 = im aktuellen Prozess)
     """
+    import fitz  # PyMuPDF
+    import img2pdf
+    
     if progress_callback:
         progress_callback(0, f"Überprüfe Datei: {os.path.basename(input_pdf)}")
     
@@ -114,13 +588,24 @@ def convert_pdf_to_bw(input_pdf, output_pdf, threshold=150, dpi=300, progress_ca
     
     start_time = time.time()
     success = False
-    bw_images = []
+    doc = None
     
     try:
+        # Bleibt bis zum Ende geöffnet, damit die Seiten ohne Prozesspool nicht neu geparst werden
         doc = fitz.open(input_pdf)
         total_pages = len(doc)
         
         # Bestimme die zu verarbeitenden Seiten
+        if isinstance(page_range, str):
+            try:
+                page_range = parse_page_range(page_range, total_pages)
+            except ValueError as e:
+                error_msg = f"Fehler beim Analysieren des Seitenbereichs: {str(e)}"
+                if progress_callback:
+                    progress_callback(-1, error_msg)
+                logger.error(error_msg)
+                page_range = None
+        
         if page_range is None:
             page_range = list(range(total_pages))
         else:
@@ -135,32 +620,62 @@ def convert_pdf_to_bw(input_pdf, output_pdf, threshold=150, dpi=300, progress_ca
             return False
         
         num_pages = len(page_range)
-        
-        for idx, page_num in enumerate(page_range):
+        indexed_pages = list(enumerate(page_range))
+        chunks = [indexed_pages[i:i+PAGES_PER_TASK] for i in range(0, num_pages, PAGES_PER_TASK)]
+        render_args = (dpi, mode, threshold, compression)
+        
+        # Ergebnisse kommen ungeordnet an und werden über den Index einsortiert
+        image_paths = [None] * num_pages
+        pages_done = 0
+        pages_passed_through = 0
+        
+        def collect(results):
+            nonlocal pages_done, pages_passed_through
+            for idx, image_path, used_dpi, passed_through in results:
+                image_paths[idx] = image_path
+                pages_passed_through += passed_through
+                if used_dpi < dpi:
+                    warning_msg = (
+                        f"⚠️ Seite {page_range[idx]+1} ist zu groß für {dpi} DPI, "
+                        f"gerendert mit {used_dpi:.0f} DPI"
+                    )
+                    if progress_callback:
+                        progress_callback(-1, warning_msg)
+                    logger.warning(warning_msg)
+            pages_done += len(results)
             if progress_callback:
-                status = f"Verarbeite Seite {idx+1}/{num_pages} (Seite {page_num+1})"
-                progress_callback((idx+1)/num_pages * 100, status)
-            
-            page = doc.load_page(page_num)
-            pix = page.get_pixmap(matrix=fitz.Matrix(dpi/72, dpi/72))
-            img_data = pix.tobytes("ppm")
-            
-            with Image.open(io.BytesIO(img_data)) as img:
-                if mode == 'bw':
-                    gray_img = img.convert('L')
-                    bw_img = gray_img.point(lambda x: 0 if x < threshold else 255, '1')
-                    img_bytes = io.BytesIO()
-                    bw_img.save(img_bytes, format='TIFF', compression='group4')
-                else:  # Graustufen
-                    gray_img = img.convert('L')
-                    img_bytes = io.BytesIO()
-                    gray_img.save(img_bytes, format='JPEG', quality=compression)
-                
-                bw_images.append(img_bytes.getvalue())
-        
-        # Erstelle PDF aus den Bildern
-        with open(output_pdf, "wb") as f:
-            f.write(img2pdf.convert(bw_images))
+                status = f"Verarbeite Seite {pages_done}/{num_pages}"
+                progress_callback(pages_done/num_pages * 100, status)
+        
+        # Seiten werden als Dateien abgelegt, damit weder der Hauptprozess noch die
+        # Prozessgrenze alle kodierten Seiten gleichzeitig im Speicher halten muss
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            if max_workers is None:
+                max_workers = _get_max_workers(len(chunks))
+            max_workers = min(max_workers, len(chunks))
+            if max_workers == 1:
+                for chunk in chunks:
+                    collect(_render_document_pages(doc, chunk, tmp_dir, *render_args))
+            else:
+                with ProcessPoolExecutor(max_workers=max_workers, mp_context=_pool_context(),
+                                         initializer=_init_worker) as executor:
+                    futures = [
+                        executor.submit(_render_pages, input_pdf, chunk, tmp_dir, *render_args)
+                        for chunk in chunks
+                    ]
+                    try:
+                        for future in as_completed(futures):
+                            collect(future.result())
+                    except Exception:
+                        # Ausstehende Blöcke nicht mehr rendern
+                        for future in futures:
+                            future.cancel()
+                        raise
+        
+            # Erstelle PDF aus den Bildern; eine EXIF-Ausrichtung übernommener JPEGs darf die Seite
+            # nicht drehen, PDF-Viewer haben sie in der Quelle ebenfalls ignoriert
+            with open(output_pdf, "wb") as f:
+                img2pdf.convert(image_paths, outputstream=f, rotation=img2pdf.Rotation.none)
         
         duration = time.time() - start_time
         success_msg = (
@@ -169,6 +684,8 @@ def convert_pdf_to_bw(input_pdf, output_pdf, threshold=150, dpi=300, progress_ca
             f"Ausgabe: {os.path.basename(output_pdf)}\n"
             f"Dateigröße: {os.path.getsize(output_pdf)/1024:.1f} KB"
         )
+        if pages_passed_through:
+            success_msg += f"\n{pages_passed_through} Seite(n) ohne Neukodierung übernommen"
         
         if progress_callback:
             progress_callback(100, success_msg)
@@ -180,30 +697,53 @@ def convert_pdf_to_bw(input_pdf, output_pdf, threshold=150, dpi=300, progress_ca
         if progress_callback:
             progress_callback(0, error_msg)
         logger.error(error_msg, exc_info=True)
+    finally:
+        if doc is not None:
+            doc.close()
     
     return success
 
+# Abfrageintervall für Fortschritt und Meldungen aus dem Worker-Thread (20 Hz)
+PROGRESS_POLL_MS = 50
+
+# Gesammelte Protokollzeilen werden höchstens mit 10 Hz ins Log-Fenster und die Logdatei geschrieben
+LOG_FLUSH_MS = 100
+
 class PDFConverterApp:
     def __init__(self, root):
         self.root = root
         self.settings = load_settings()
+        # Zuletzt gespeicherter Stand, um unveränderte Einstellungen nicht erneut zu schreiben
+        self._last_saved_settings = dict(self.settings)
         self.root.title("PDF zu Schwarz-Weiß Konverter")
         self.root.geometry("800x700")
         self.root.resizable(True, True)
         
         # Variablen initialisieren
         self.input_files = []
-        self.current_file_index = 0
         self.total_files = 0
         
+        # Ein dauerhafter Worker-Thread arbeitet die Konvertierungsaufträge ab
+        self.job_queue = queue.Queue()
+        # Enthält nur den neuesten, noch nicht angezeigten Fortschritt
+        self.progress_queue = queue.Queue(maxsize=1)
+        # Meldungen und Ereignisse, die vollständig im GUI-Thread verarbeitet werden
+        self.event_queue = queue.Queue()
+        
+        # Protokollzeilen, die beim nächsten _flush_log gemeinsam geschrieben werden
+        self._log_buf = collections.deque()
+        self._log_flush_scheduled = False
+        
         self.threshold_value = tk.IntVar(value=self.settings['threshold'])
-        self.dpi_value = tk.StringVar(value=str(self.settings['dpi']))
+        self.dpi_value = tk.StringVar(value=str(min(self.settings['dpi'], MAX_DPI)))
         self.open_after_var = tk.BooleanVar(value=self.settings['open_after'])
         self.page_range_var = tk.StringVar(value=self.settings['page_range'])
         self.overwrite_var = tk.StringVar(value=self.settings['overwrite'])
         self.mode_var = tk.StringVar(value=self.settings['mode'])
         self.compression_var = tk.IntVar(value=self.settings['compression'])
         self.timestamp_var = tk.BooleanVar(value=False)
+        self.append_files_var = tk.BooleanVar(value=False)
+        self.parallel_files_var = tk.IntVar(value=self.settings['parallel_files'])
         
         # Stilkonfiguration
         self.style = ttk.Style()
@@ -212,6 +752,9 @@ class PDFConverterApp:
         self.style.configure("TFrame", padding=10)
         
         self.create_widgets()
+        
+        threading.Thread(target=self._worker, daemon=True).start()
+        self.root.after(PROGRESS_POLL_MS, self._drain_progress)
     
     def create_widgets(self):
         # Haupt-Notebook für Tabs
@@ -250,6 +793,11 @@ class PDFConverterApp:
         
         ttk.Button(btn_frame, text="Dateien hinzufügen", command=self.browse_input).pack(side=tk.LEFT, padx=5)
         ttk.Button(btn_frame, text="Alle entfernen", command=self.clear_input).pack(side=tk.LEFT, padx=5)
+        ttk.Checkbutton(
+            btn_frame,
+            text="An Liste anhängen",
+            variable=self.append_files_var
+        ).pack(side=tk.LEFT, padx=10)
         
         # Ausgabeeinstellungen
         output_frame = ttk.LabelFrame(parent, text="Ausgabeeinstellungen")
@@ -291,6 +839,38 @@ class PDFConverterApp:
         self.page_range_entry.pack(side=tk.LEFT, padx=5)
         self.page_range_entry.insert(0, self.settings['page_range'])
         
+        # Auflösung
+        dpi_frame = ttk.Frame(conv_frame)
+        dpi_frame.pack(fill=tk.X, pady=5)
+        
+        ttk.Label(dpi_frame, text="Auflösung (DPI):").pack(side=tk.LEFT)
+        ttk.Spinbox(
+            dpi_frame,
+            values=(72, 100, 150, 200, 300, 400, 600),
+            textvariable=self.dpi_value,
+            width=6,
+            validate='key',
+            validatecommand=(self.root.register(self.validate_dpi), '%P')
+        ).pack(side=tk.LEFT, padx=5)
+        ttk.Label(
+            dpi_frame,
+            text=f"max. {MAX_DPI} – höhere Werte vervielfachen Rechenzeit und Speicherbedarf ohne sichtbaren Qualitätsgewinn",
+            foreground="gray"
+        ).pack(side=tk.LEFT)
+        
+        # Parallele Dateien
+        parallel_frame = ttk.Frame(conv_frame)
+        parallel_frame.pack(fill=tk.X, pady=5)
+        
+        ttk.Label(parallel_frame, text="Parallele Dateien:").pack(side=tk.LEFT)
+        ttk.Spinbox(
+            parallel_frame,
+            from_=1,
+            to=os.cpu_count() or 1,
+            textvariable=self.parallel_files_var,
+            width=4
+        ).pack(side=tk.LEFT, padx=5)
+        
         # Modus
         mode_frame = ttk.Frame(conv_frame)
         mode_frame.pack(fill=tk.X, pady=5)
@@ -414,15 +994,28 @@ class PDFConverterApp:
     def update_compression_label(self, *args):
         self.compression_label.config(text=str(self.compression_var.get()))
     
+    def validate_dpi(self, value):
+        return value == "" or (value.isdigit() and int(value) <= MAX_DPI)
+    
     def browse_input(self):
         file_paths = filedialog.askopenfilenames(
             filetypes=[("PDF Dateien", "*.pdf"), ("Alle Dateien", "*.*")]
         )
-        if file_paths:
-            self.input_files = list(file_paths)
+        if not file_paths:
+            return
+        
+        if self.append_files_var.get():
+            known = set(self.input_files)
+            new_files = [p for p in file_paths if p not in known]
+        else:
+            new_files = list(file_paths)
+            self.input_files = []
             self.input_listbox.delete(0, tk.END)
-            for file_path in self.input_files:
-                self.input_listbox.insert(tk.END, os.path.basename(file_path))
+        
+        self.input_files.extend(new_files)
+        # Ein einziger insert-Aufruf statt einem pro Datei
+        if new_files:
+            self.input_listbox.insert(tk.END, *[os.path.basename(p) for p in new_files])
     
     def clear_input(self):
         self.input_files = []
@@ -436,7 +1029,9 @@ class PDFConverterApp:
     
     def save_app_settings(self):
         self.settings['threshold'] = self.threshold_value.get()
-        self.settings['dpi'] = int(self.dpi_value.get())
+        dpi = int(self.dpi_value.get() or DEFAULT_SETTINGS['dpi'])
+        self.settings['dpi'] = min(max(dpi, 72), MAX_DPI)
+        self.dpi_value.set(str(self.settings['dpi']))
         self.settings['open_after'] = self.open_after_var.get()
         self.settings['output_dir'] = self.output_dir_entry.get().strip()
         self.settings['output_suffix'] = self.suffix_entry.get().strip()
@@ -444,15 +1039,38 @@ class PDFConverterApp:
         self.settings['mode'] = self.mode_var.get()
         self.settings['overwrite'] = self.overwrite_var.get()
         self.settings['compression'] = self.compression_var.get()
-        
-        save_settings(self.settings)
+        try:
+            # Direkt eingetippte Werte umgehen die Grenzen der Spinbox
+            parallel_files = self.parallel_files_var.get()
+            self.settings['parallel_files'] = min(max(parallel_files, 1), os.cpu_count() or 1)
+        except tk.TclError:
+            pass
+        self.parallel_files_var.set(self.settings['parallel_files'])
+        
+        if self.settings != self._last_saved_settings:
+            save_settings(self.settings)
+            self._last_saved_settings = dict(self.settings)
     
     def log_message(self, message):
+        self._log_buf.append(message)
+        if not self._log_flush_scheduled:
+            self._log_flush_scheduled = True
+            self.root.after(LOG_FLUSH_MS, self._flush_log)
+    
+    def _flush_log(self):
+        """Schreibt alle gesammelten Zeilen mit einem insert/see und einem Logeintrag"""
+        self._log_flush_scheduled = False
+        if not self._log_buf:
+            return
+        
+        text = "\n".join(self._log_buf)
+        self._log_buf.clear()
+        
         self.log_text.config(state=tk.NORMAL)
-        self.log_text.insert(tk.END, message + "\n")
+        self.log_text.insert(tk.END, text + "\n")
         self.log_text.see(tk.END)
         self.log_text.config(state=tk.DISABLED)
-        logger.info(message)
+        logger.info(text)
     
     def update_progress(self, percent, message):
         if percent >= 0:
@@ -470,66 +1088,69 @@ class PDFConverterApp:
         # Einstellungen speichern
         self.save_app_settings()
         
-        self.current_file_index = 0
-        self.total_files = len(self.input_files)
+        # Syntax des Seitenbereichs vorab prüfen; die Seitenzahl wird dafür nicht benötigt
+        try:
+            parse_page_range(self.settings['page_range'], 0)
+        except ValueError as e:
+            messagebox.showerror(
+                "Ungültiger Seitenbereich",
+                f"Der Seitenbereich ist ungültig: {str(e)}\nBeispiel: 1-5,8,11-"
+            )
+            return
         
         # Log zurücksetzen
-        self.log_text.config(state=tk.NORMAL)
-        self.log_text.delete(1.0, tk.END)
-        self.log_text.config(state=tk.DISABLED)
+        self.clear_log()
         self.progress_bar['value'] = 0
-        self.status_label.config(text="Konvertierung wird gestartet...")
-        self.convert_btn.config(state=tk.DISABLED)
         
-        # Starte Konvertierung
-        self.convert_next_file()
-    
-    def convert_next_file(self):
-        if self.current_file_index >= self.total_files:
+        jobs = self.prepare_jobs()
+        self.total_files = len(jobs)
+        if not jobs:
             self.update_progress(100, "✅ Alle Konvertierungen abgeschlossen!")
-            self.convert_btn.config(state=tk.NORMAL)
             return
         
-        input_path = self.input_files[self.current_file_index]
-        output_path = self.generate_output_path(input_path)
-        
-        # Überschreiben prüfen
-        if os.path.exists(output_path):
-            overwrite = self.settings['overwrite']
-            if overwrite == 'ask':
-                response = messagebox.askyesno(
-                    "Datei existiert",
-                    f"Die Ausgabedatei '{os.path.basename(output_path)}' existiert bereits. Überschreiben?"
-                )
-                if not response:
-                    self.log_message(f"Überspringen: {os.path.basename(input_path)}")
-                    self.current_file_index += 1
-                    self.convert_next_file()
-                    return
-            elif overwrite == 'skip':
-                self.log_message(f"Überspringen: {os.path.basename(input_path)}")
-                self.current_file_index += 1
-                self.convert_next_file()
-                return
-        
-        # Seitenbereich analysieren
-        page_range_str = self.page_range_entry.get().strip()
-        page_range = None
-        if page_range_str:
-            try:
-                with fitz.open(input_path) as doc:
-                    total_pages = len(doc)
-                    page_range = parse_page_range(page_range_str, total_pages)
-            except Exception as e:
-                self.log_message(f"Fehler beim Analysieren des Seitenbereichs: {str(e)}")
-                page_range = None
+        self.status_label.config(text="Konvertierung wird gestartet...")
+        self.convert_btn.config(state=tk.DISABLED)
         
-        # Starte Konvertierung im Hintergrund
-        threading.Thread(
-            target=self.run_conversion,
-            args=(input_path, output_path, page_range),
-            daemon=True
-        ).start()
+        # Einstellungen werden im GUI-Thread festgehalten, der Worker liest keine Tk-Variablen
+        options = {
+            'threshold': self.settings['threshold'],
+            'dpi': self.settings['dpi'],
+            'mode': self.settings['mode'],
+            'compression': self.settings['compression'],
+            'open_after': self.settings['open_after'],
+            'parallel_files': self.settings['parallel_files'],
+        }
+        self.job_queue.put((jobs, options))
+    
+    def prepare_jobs(self):
+        """
+        Ermittelt Ausgabepfade und klärt vorhandene Ausgabedateien, solange noch der GUI-Thread aktiv ist
+        :return: Liste von (input_path, output_path, page_range)-Tupeln
+        """
+        # Seitenbereich wird erst bei der Konvertierung analysiert, die die PDF ohnehin öffnet
+        page_range = self.page_range_entry.get().strip() or None
+        
+        jobs = []
+        for input_path in self.input_files:
+            output_path = self.generate_output_path(input_path)
+            
+            # Überschreiben prüfen
+            if os.path.exists(output_path):
+                overwrite = self.settings['overwrite']
+                if overwrite == 'ask':
+                    response = messagebox.askyesno(
+                        "Datei existiert",
+                        f"Die Ausgabedatei '{os.path.basename(output_path)}' existiert bereits. Überschreiben?"
+                    )
+                    if not response:
+                        self.log_message(f"Überspringen: {os.path.basename(input_path)}")
+                        continue
+                elif overwrite == 'skip':
+                    self.log_message(f"Überspringen: {os.path.basename(input_path)}")
+                    continue
+            
+            jobs.append((input_path, output_path, page_range))
+        return jobs
     
     def generate_output_path(self, input_path):
         output_dir = self.output_dir_entry.get().strip() or os.path.dirname(input_path)
@@ -548,26 +1169,123 @@ class PDFConverterApp:
         
         return os.path.join(output_dir, base + ext)
     
-    def run_conversion(self, input_path, output_path, page_range):
-        def progress_callback(percent, message):
-            self.root.after(10, lambda: self.update_progress(percent, message))
-        
+    def _worker(self):
+        while True:
+            jobs, options = self.job_queue.get()
+            try:
+                # Mehrere Dateien werden parallel verarbeitet, die Kerne teilen sie sich für ihre Seiten
+                max_workers = min(options['parallel_files'], len(jobs))
+                if max_workers > 1:
+                    self.run_parallel_conversions(jobs, options, max_workers)
+                else:
+                    for input_path, output_path, page_range in jobs:
+                        self.run_conversion(input_path, output_path, page_range, options)
+            except Exception as e:
+                # Z. B. ein Prozesspool, der nicht startet oder abbricht; der Thread muss weiterlaufen
+                error_msg = f"❌ FEHLER bei der Stapelverarbeitung: {str(e)}"
+                logger.error(error_msg, exc_info=True)
+                self.event_queue.put(('log', error_msg))
+            finally:
+                self.event_queue.put(('done', None))
+    
+    def run_conversion(self, input_path, output_path, page_range, options):
         success = convert_pdf_to_bw(
             input_path,
             output_path,
-            threshold=self.threshold_value.get(),
-            dpi=int(self.dpi_value.get()),
-            progress_callback=progress_callback,
+            threshold=options['threshold'],
+            dpi=options['dpi'],
+            progress_callback=self._post_progress,
             page_range=page_range,
-            mode=self.mode_var.get(),
-            compression=self.compression_var.get()
+            mode=options['mode'],
+            compression=options['compression']
         )
         
-        if success and self.open_after_var.get():
-            self.root.after(100, lambda: self.open_file(output_path))
+        if success and options['open_after']:
+            self.event_queue.put(('open', output_path))
+    
+    def run_parallel_conversions(self, jobs, options, max_workers):
+        """
+        Verteilt ganze Dateien auf einen Prozesspool. Jede Datei erhält ihren Anteil der Kerne
+        für das seitenweise Rendern, damit wenige große Dateien trotzdem alle Kerne nutzen.
+        """
+        page_workers = max(1, (os.cpu_count() or 1) // max_workers)
+        files_done = 0
+        with ProcessPoolExecutor(max_workers=max_workers, mp_context=_pool_context(),
+                                 initializer=_init_worker) as executor:
+            futures = {
+                executor.submit(
+                    _convert_file_job, input_path, output_path, page_range, options, page_workers
+                ): (input_path, output_path)
+                for input_path, output_path, page_range in jobs
+            }
+            
+            for future in as_completed(futures):
+                input_path, output_path = futures[future]
+                files_done += 1
+                try:
+                    success, records = future.result()
+                    # Wie bei der Einzelkonvertierung in die Logdatei und ins Protokoll-Fenster
+                    for level, message, log_text in records:
+                        logger.log(level, log_text)
+                        self.event_queue.put(('log', message))
+                except Exception as e:
+                    error_msg = f"FEHLER während der Konvertierung: {str(e)}"
+                    logger.error(error_msg, exc_info=True)
+                    self.event_queue.put(('log', error_msg))
+                    success = False
+                
+                if success:
+                    status = f"✅ {files_done}/{len(jobs)} Dateien: {os.path.basename(output_path)} erstellt"
+                else:
+                    status = f"❌ {files_done}/{len(jobs)} Dateien: {os.path.basename(input_path)} fehlgeschlagen (siehe {log_file})"
+                self._post_progress(files_done/len(jobs) * 100, status)
+                
+                if success and options['open_after']:
+                    self.event_queue.put(('open', output_path))
+    
+    def _post_progress(self, percent, message):
+        """Wird im Worker-Thread aufgerufen; ersetzt einen noch nicht angezeigten Fortschritt"""
+        try:
+            self.progress_queue.get_nowait()
+        except queue.Empty:
+            pass
+        try:
+            self.progress_queue.put_nowait((percent, message))
+        except queue.Full:
+            pass
+        self.event_queue.put(('log', message))
+    
+    def _drain_progress(self):
+        """Übernimmt im festen Takt den neuesten Fortschritt und alle angefallenen Meldungen"""
+        try:
+            percent, message = self.progress_queue.get_nowait()
+        except queue.Empty:
+            pass
+        else:
+            if percent >= 0:
+                self.progress_bar['value'] = percent
+            self.status_label.config(text=message)
+        
+        while True:
+            try:
+                kind, payload = self.event_queue.get_nowait()
+            except queue.Empty:
+                break
+            
+            if kind == 'log':
+                self.log_message(payload)
+            elif kind == 'open':
+                self.open_file(payload)
+            elif kind == 'done':
+                # Veralteten Fortschritt verwerfen, damit er die Abschlussmeldung nicht überschreibt
+                try:
+                    self.progress_queue.get_nowait()
+                except queue.Empty:
+                    pass
+                self.update_progress(100, "✅ Alle Konvertierungen abgeschlossen!")
+                self.convert_btn.config(state=tk.NORMAL)
         
-        self.current_file_index += 1
-        self.root.after(10, self.convert_next_file)
+        self.root.after(PROGRESS_POLL_MS, self._drain_progress)
     
     def open_file(self, path):
         try:
@@ -586,6 +1304,7 @@ class PDFConverterApp:
             filetypes=[("Textdateien", "*.txt"), ("Alle Dateien", "*.*")]
         )
         if file_path:
+            self._flush_log()
             try:
                 with open(file_path, "w") as f:
                     f.write(self.log_text.get("1.0", tk.END))
@@ -594,11 +1313,16 @@ class PDFConverterApp:
                 messagebox.showerror("Fehler", f"Protokoll konnte nicht exportiert werden: {str(e)}")
     
     def clear_log(self):
+        # Noch gesammelte Zeilen zuerst in die Logdatei schreiben
+        self._flush_log()
         self.log_text.config(state=tk.NORMAL)
         self.log_text.delete(1.0, tk.END)
         self.log_text.config(state=tk.DISABLED)
 
 if __name__ == "__main__":  
+    # Nötig für den Prozesspool in eingefrorenen Windows-Builds
+    multiprocessing.freeze_support()
+    setup_logging()
     root = tk.Tk()
     app = PDFConverterApp(root)
     root.mainloop()